@@ -7,11 +7,24 @@ https://recruiting.ultipro.com/HAY1004HAUS/JobBoard/bebb31cb-327e-46b6-80a7-e003
 from __future__ import annotations
 
 import datetime as dt
-import json
-import urllib.request
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional
 
-from openpyxl import Workbook
+import requests
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import dumps as json_dumps, loads as json_loads
+
+try:
+    from ciso8601 import parse_datetime as parse_iso
+except ImportError:  # ciso8601 is optional; fromisoformat needs "Z" spelled as an offset
+    def parse_iso(raw: str) -> dt.datetime:
+        return dt.datetime.fromisoformat(raw.replace("Z", "+00:00"))
 
 BASE_URL = "https://recruiting.ultipro.com/HAY1004HAUS/JobBoard/bebb31cb-327e-46b6-80a7-e0033ffa4653"
 LOAD_URL = f"{BASE_URL}/JobBoardView/LoadSearchResults"
@@ -22,6 +35,10 @@ HEADERS = {
     "X-Requested-With": "XMLHttpRequest",
 }
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 ORDER_BY = [{"Value": "postedDateDesc", "PropertyName": "PostedDate", "Ascending": False}]
 MATCH_CRITERIA = {
     "PreferredJobs": [],
@@ -31,11 +48,27 @@ MATCH_CRITERIA = {
     "hasNoLicenses": False,
     "SkippedSkills": [],
 }
+CONCURRENCY = 8  # pages requested in flight at once
+XLSX_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_urls": False,
+    "remove_timezone": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+
+class Job(NamedTuple):
+    id: Optional[str]
+    title: str
+    category: str
+    full_time: Optional[bool]
+    location: str
+    posted: dt.datetime
+    requisition: Optional[str]
+    url: str
 
 
-def fetch_page(
-    opener: urllib.request.OpenerDirector, skip: int, top: int
-) -> Dict:
+def fetch_page(skip: int, top: int) -> Dict:
     payload = {
         "opportunitySearch": {
             "Top": top,
@@ -47,22 +80,21 @@ def fetch_page(
         },
         "matchCriteria": MATCH_CRITERIA,
     }
-    headers = dict(HEADERS)
-    req = urllib.request.Request(
-        LOAD_URL, data=json.dumps(payload).encode("utf-8"), headers=headers
-    )
-    with opener.open(req) as resp:
-        return json.loads(resp.read().decode("utf-8", errors="ignore"))
+    resp = SESSION.post(LOAD_URL, data=json_dumps(payload))
+    resp.raise_for_status()
+    return json_loads(resp.content)
 
 
+@lru_cache(maxsize=4096)
 def parse_posted_date(raw: str | None) -> Optional[dt.datetime]:
     if not raw:
         return None
     try:
-        parsed = dt.datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        parsed = parse_iso(raw)
     except ValueError:
         return None
-    return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
+    # Normalise to UTC once here so the writers can format the value directly.
+    return parsed.astimezone(dt.timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
 
 
 def format_locations(locations: List[dict]) -> str:
@@ -70,87 +102,104 @@ def format_locations(locations: List[dict]) -> str:
     for loc in locations or []:
         address = loc.get("Address") or {}
         city = address.get("City") or ""
-        state = (address.get("State") or {}).get("Code") or (address.get("State") or {}).get("Name") or ""
-        label = ", ".join(filter(None, [city, state]))
+        st = address.get("State") or {}
+        state = st.get("Code") or st.get("Name") or ""
+        label = f"{city}, {state}" if city and state else (city or state)
         desc = loc.get("LocalizedDescription") or ""
         if desc and desc not in label:
             label = f"{label} ({desc})" if label else desc
         if label:
             parts.append(label)
 
-    unique = []
-    for item in parts:
-        if item not in unique:
-            unique.append(item)
-    return "; ".join(unique)
-
+    # dict.fromkeys drops duplicates while keeping first-seen order.
+    return "; ".join(dict.fromkeys(parts))
 
-def collect_recent_jobs(cutoff: dt.datetime) -> List[dict]:
-    opener = urllib.request.build_opener()
 
+def collect_recent_jobs(cutoff: dt.datetime) -> List[Job]:
     skip = 0
     top = 50
     total = None
-    recent: List[dict] = []
-
-    while True:
-        data = fetch_page(opener, skip, top)
-        opportunities = data.get("opportunities", [])
-        if not opportunities:
-            break
-
-        if total is None:
-            total = data.get("totalCount", 0)
-
-        for job in opportunities:
-            posted_dt = parse_posted_date(job.get("PostedDate"))
-            if posted_dt is None or posted_dt < cutoff:
-                continue
-
-            recent.append(
-                {
-                    "id": job.get("Id"),
-                    "title": (job.get("Title") or "").strip(),
-                    "category": (job.get("JobCategoryName") or "").strip(),
-                    "full_time": job.get("FullTime"),
-                    "location": format_locations(job.get("Locations") or []),
-                    "posted": posted_dt,
-                    "requisition": job.get("RequisitionNumber"),
-                    "url": f"{BASE_URL}/OpportunityDetail?opportunityId={job.get('Id')}",
-                }
-            )
-
-        oldest = None
-        for job in reversed(opportunities):
-            oldest = parse_posted_date(job.get("PostedDate"))
-            if oldest:
-                break
-
-        skip += top
-        if (oldest and oldest < cutoff) or (total is not None and skip >= total):
-            break
-
-    recent.sort(key=lambda j: j["posted"], reverse=True)
+    recent: List[Job] = []
+    done = False
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        # Keep up to CONCURRENCY pages in flight and top the window up before
+        # parsing each page, so network waits overlap with the parse. Only the
+        # first page is requested up front because it reports the total.
+        pending = deque([pool.submit(fetch_page, 0, top)])
+        next_skip = top
+        try:
+            while pending and not done:
+                data = pending.popleft().result()
+                opportunities = data.get("opportunities", [])
+                if not opportunities:
+                    break
+
+                if total is None:
+                    total = data.get("totalCount", 0)
+                while len(pending) < CONCURRENCY and (total is None or next_skip < total):
+                    pending.append(pool.submit(fetch_page, next_skip, top))
+                    next_skip += top
+
+                for job in opportunities:
+                    posted_dt = parse_posted_date(job.get("PostedDate"))
+                    if posted_dt is None:
+                        continue
+                    if posted_dt < cutoff:
+                        # Results are ordered newest first, so the rest are older too.
+                        done = True
+                        break
+
+                    recent.append(
+                        Job(
+                            id=job.get("Id"),
+                            title=(job.get("Title") or "").strip(),
+                            category=(job.get("JobCategoryName") or "").strip(),
+                            full_time=job.get("FullTime"),
+                            location=format_locations(job.get("Locations") or []),
+                            posted=posted_dt,
+                            requisition=job.get("RequisitionNumber"),
+                            url=f"{BASE_URL}/OpportunityDetail?opportunityId={job.get('Id')}",
+                        )
+                    )
+
+                skip += top
+                if total is not None and skip >= total:
+                    break
+        finally:
+            # Drop any prefetched requests that have not started yet.
+            for future in pending:
+                future.cancel()
+
+    recent.sort(key=attrgetter("posted"), reverse=True)
     return recent
 
 
-def write_text(jobs: List[dict], path: str) -> None:
-    lines = []
-    for job in jobs:
-        posted_str = job["posted"].astimezone(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ")
-        full_time = "Full Time" if job["full_time"] else "Part Time/Other"
-        summary = " | ".join(filter(None, [job["location"], job["category"], full_time]))
-        lines.append(f"{job['title']} | {summary} | Posted: {posted_str} | {job['url']}")
-    output = "\n".join(lines) if lines else "No jobs found in the last 24 hours."
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(output)
+def format_line(job: Job) -> str:
+    posted_str = job.posted.isoformat(" ", "seconds").replace("+00:00", "Z")
+    full_time = "Full Time" if job.full_time else "Part Time/Other"
+    summary = " | ".join(filter(None, [job.location, job.category, full_time]))
+    return f"{job.title} | {summary} | Posted: {posted_str} | {job.url}"
+
 
+def write_text(jobs: List[Job], path: str) -> None:
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if not jobs:
+            f.write("No jobs found in the last 24 hours.")
+            return
+        f.writelines(f"{format_line(job)}\n" for job in jobs)
 
-def write_excel(jobs: List[dict], path: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Hays Jobs (24h)"
-    ws.append(
+
+def write_excel(jobs: List[Job], path: str) -> None:
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(path, XLSX_OPTIONS)
+    ws = wb.add_worksheet("Hays Jobs (24h)")
+    for col, width in enumerate((60, 35, 20, 10, 20, 70, 36)):
+        ws.set_column(col, col, width)
+    ws.write_row(
+        0,
+        0,
         [
             "Title",
             "Location",
@@ -160,27 +209,26 @@ def write_excel(jobs: List[dict], path: str) -> None:
             "URL",
             "Job ID",
             "Requisition",
-        ]
+        ],
     )
 
-    for job in jobs:
-        ws.append(
-            [
-                job["title"],
-                job["location"],
-                job["category"],
-                "Yes" if job["full_time"] else "No",
-                job["posted"].astimezone(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-                job["url"],
-                job["id"],
-                job["requisition"],
-            ]
+    for row, job in enumerate(jobs, 1):
+        ws.write_row(
+            row,
+            0,
+            (
+                job.title,
+                job.location,
+                job.category,
+                "Yes" if job.full_time else "No",
+                job.posted,
+                job.url,
+                job.id,
+                job.requisition,
+            ),
         )
 
-    for col, width in {"A": 60, "B": 35, "C": 20, "D": 10, "E": 20, "F": 70, "G": 36}.items():
-        ws.column_dimensions[col].width = width
-
-    wb.save(path)
+    wb.close()
 
 
 def main() -> None:
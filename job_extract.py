@@ -10,15 +10,21 @@ from __future__ import annotations
 
 import datetime as dt
 import html
-import json
 import re
 import sys
-import urllib.error
-import urllib.request
-from typing import Iterable, List, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+import requests
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as json_loads
 
 
 # A broad search term is required; a single letter returns all the newest jobs.
@@ -29,112 +35,177 @@ BASE_URL = (
 )
 HEADERS = {"User-Agent": "Mozilla/5.0 (job-scraper)"}
 MAX_PAGES = 50  # fail-safe upper bound
-
-# Regex to capture the job link, title, and inline JSON payload for each row.
-JOB_BLOCK_RE = re.compile(
+CONCURRENCY = 8  # pages requested in flight at once
+XLSX_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_urls": False,
+    "remove_timezone": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Regex to capture the job link and title that open each result row.
+JOB_TITLE_RE = re.compile(
     r"<div class=\"job-title\"><a href='(?P<href>[^']+)'[^>]*>"
-    r"(?P<title>[^<]+)</a>.*?"
-    r"<div style=\"display:none;\">(?P<data>{.*?})</div>",
-    re.S,
+    r"(?P<title>[^<]+)</a>"
 )
+# Regex for the inline JSON payload; only searched within a single row's span.
+JOB_DATA_RE = re.compile(r"<div style=\"display:none;\">(?P<data>\{[^<]*\})</div>")
+
+
+class Job(NamedTuple):
+    title: str
+    href: str
+    city: str
+    state: str
+    job_type: str
+    posted: dt.datetime
+    job_id: Optional[int]
+    salary_low: Optional[float]
+    salary_high: Optional[float]
 
 
 def fetch(url: str) -> str:
-    req = urllib.request.Request(url, headers=HEADERS)
-    with urllib.request.urlopen(req) as resp:
-        return resp.read().decode("utf-8", errors="ignore")
+    resp = SESSION.get(url)
+    resp.raise_for_status()
+    return resp.content.decode("utf-8", errors="ignore")
 
 
 def parse_jobs(html_text: str) -> Iterable[Tuple[str, str, dict]]:
     """Yield (title, href, metadata) tuples from the HTML page."""
-    for match in JOB_BLOCK_RE.finditer(html_text):
+    rows = list(JOB_TITLE_RE.finditer(html_text))
+    for i, row in enumerate(rows):
+        # Bound the payload search by the next row so no match spans two results.
+        end = rows[i + 1].start() if i + 1 < len(rows) else len(html_text)
+        match = JOB_DATA_RE.search(html_text, row.end(), end)
+        if not match:
+            continue
         raw_json = html.unescape(match.group("data"))
         try:
-            meta = json.loads(raw_json)
-        except json.JSONDecodeError:
+            meta = json_loads(raw_json)
+        except ValueError:
             continue
-        yield match.group("title"), match.group("href"), meta
+        yield row.group("title"), row.group("href"), meta
 
 
+@lru_cache(maxsize=4096)
 def parse_posted_date(raw: str) -> dt.datetime | None:
-    m = re.search(r"/Date\((\d+)\)/", raw)
-    if not m:
+    # PostedDate looks like "/Date(1700000000000)/"; str.find is cheaper than a regex here.
+    start = raw.find("/Date(")
+    if start < 0:
+        return None
+    start += len("/Date(")
+    end = raw.find(")/", start)
+    digits = raw[start:end]
+    if end < 0 or not digits.isdecimal():
         return None
-    ts_ms = int(m.group(1))
-    return dt.datetime.fromtimestamp(ts_ms / 1000, tz=dt.timezone.utc)
+    return dt.datetime.fromtimestamp(int(digits) / 1000, tz=dt.timezone.utc)
 
 
-def scrape_recent_jobs(cutoff: dt.datetime) -> tuple[List[dict], List[str]]:
-    recent: List[dict] = []
+def page_url(page: int) -> str:
+    page_path = "" if page == 1 else f"{page}/"
+    return BASE_URL.format(page=page_path)
+
+
+def scrape_recent_jobs(cutoff: dt.datetime) -> tuple[List[Job], List[str]]:
+    recent: List[Job] = []
     visited: List[str] = []
-    for page in range(1, MAX_PAGES + 1):
-        page_path = "" if page == 1 else f"{page}/"
-        url = BASE_URL.format(page=page_path)
-        visited.append(url)
+    pages = iter(range(1, MAX_PAGES + 1))
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        # Keep CONCURRENCY pages in flight and top the window up before parsing
+        # each page, so network waits overlap with the parse.
+        pending = deque(
+            (page, pool.submit(fetch, page_url(page))) for page in islice(pages, CONCURRENCY)
+        )
         try:
-            html_text = fetch(url)
-        except urllib.error.URLError as exc:  # network issue; stop gracefully
-            print(f"Failed to fetch page {page}: {exc}", file=sys.stderr)
-            break
-
-        jobs_on_page = list(parse_jobs(html_text))
-        if not jobs_on_page:
-            break
-
-        page_has_newer = False
-        for title, href, meta in jobs_on_page:
-            posted_dt = parse_posted_date(meta.get("PostedDate", ""))
-            if posted_dt is None:
-                continue
-            if posted_dt < cutoff:
-                continue
-
-            page_has_newer = True
-            recent.append(
-                {
-                    "title": title.strip(),
-                    "href": "https://jobs.insightglobal.com" + href,
-                    "city": meta.get("City", ""),
-                    "state": meta.get("State", ""),
-                    "job_type": ", ".join(meta.get("JobType", [])),
-                    "posted": posted_dt,
-                    "job_id": meta.get("JobID"),
-                    "salary_low": meta.get("SalaryLow"),
-                    "salary_high": meta.get("SalaryHigh"),
-                }
-            )
-
-        # Pages are ordered by most recent; once an entire page is older we can stop.
-        if not page_has_newer:
-            break
+            while pending:
+                page, future = pending.popleft()
+                visited.append(page_url(page))
+                try:
+                    html_text = future.result()
+                except requests.RequestException as exc:  # network issue; stop gracefully
+                    print(f"Failed to fetch page {page}: {exc}", file=sys.stderr)
+                    break
+
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append((next_page, pool.submit(fetch, page_url(next_page))))
+
+                jobs_on_page = list(parse_jobs(html_text))
+                if not jobs_on_page:
+                    break
+
+                page_has_newer = False
+                for title, href, meta in jobs_on_page:
+                    posted_dt = parse_posted_date(meta.get("PostedDate", ""))
+                    if posted_dt is None:
+                        continue
+                    if posted_dt < cutoff:
+                        continue
+
+                    page_has_newer = True
+                    recent.append(
+                        Job(
+                            title=title.strip(),
+                            href="https://jobs.insightglobal.com" + href,
+                            city=meta.get("City", ""),
+                            state=meta.get("State", ""),
+                            job_type=", ".join(meta.get("JobType", [])),
+                            posted=posted_dt,
+                            job_id=meta.get("JobID"),
+                            salary_low=meta.get("SalaryLow"),
+                            salary_high=meta.get("SalaryHigh"),
+                        )
+                    )
+
+                # Pages are ordered by most recent; once an entire page is older we can stop.
+                if not page_has_newer:
+                    break
+        finally:
+            # Drop any prefetched requests that have not started yet.
+            for _, future in pending:
+                future.cancel()
 
     # Sort newest first for consistency.
-    recent.sort(key=lambda j: j["posted"], reverse=True)
+    recent.sort(key=attrgetter("posted"), reverse=True)
     return recent, visited
 
 
-def write_output(jobs: List[dict], path: str) -> None:
-    lines = []
-    for job in jobs:
-        posted_str = job["posted"].astimezone(dt.timezone.utc).strftime(
-            "%Y-%m-%d %H:%M:%SZ"
-        )
-        location = ", ".join(filter(None, [job["city"], job["state"]]))
-        line = (
-            f"{job['title']} | {location} | {job['job_type']} | "
-            f"Posted: {posted_str} | {job['href']}"
-        )
-        lines.append(line)
+def format_location(job: Job) -> str:
+    city, state = job.city, job.state
+    return f"{city}, {state}" if city and state else (city or state or "")
+
+
+def format_line(job: Job) -> str:
+    posted_str = job.posted.isoformat(" ", "seconds").replace("+00:00", "Z")
+    location = format_location(job)
+    return (
+        f"{job.title} | {location} | {job.job_type} | "
+        f"Posted: {posted_str} | {job.href}"
+    )
+
 
-    output = "\n".join(lines) if lines else "No jobs found in the last 24 hours."
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(output)
+def write_output(jobs: List[Job], path: str) -> None:
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if not jobs:
+            f.write("No jobs found in the last 24 hours.")
+            return
+        f.writelines(f"{format_line(job)}\n" for job in jobs)
 
 
-def write_excel(jobs: List[dict], path: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Jobs (last 24h)"
+def write_excel(jobs: List[Job], path: str) -> None:
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(path, XLSX_OPTIONS)
+    ws = wb.add_worksheet("Jobs (last 24h)")
+    # Basic column sizing for readability.
+    widths = (60, 25, 18, 20, 60, 10, 12, 12)
+    for col, width in enumerate(widths):
+        ws.set_column(col, col, width)
 
     headers = [
         "Title",
@@ -146,41 +217,25 @@ def write_excel(jobs: List[dict], path: str) -> None:
         "Salary Low",
         "Salary High",
     ]
-    ws.append(headers)
-
-    for job in jobs:
-        location = ", ".join(filter(None, [job["city"], job["state"]]))
-        posted_str = job["posted"].astimezone(dt.timezone.utc).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
-        ws.append(
-            [
-                job["title"],
-                location,
-                job["job_type"],
-                posted_str,
-                job["href"],
-                job["job_id"],
-                job["salary_low"],
-                job["salary_high"],
-            ]
+    ws.write_row(0, 0, headers)
+
+    for row, job in enumerate(jobs, 1):
+        ws.write_row(
+            row,
+            0,
+            (
+                job.title,
+                format_location(job),
+                job.job_type,
+                job.posted,
+                job.href,
+                job.job_id,
+                job.salary_low,
+                job.salary_high,
+            ),
         )
 
-    # Basic column sizing for readability.
-    widths = {
-        "A": 60,
-        "B": 25,
-        "C": 18,
-        "D": 20,
-        "E": 60,
-        "F": 10,
-        "G": 12,
-        "H": 12,
-    }
-    for col, width in widths.items():
-        ws.column_dimensions[col].width = width
-
-    wb.save(path)
+    wb.close()
 
 
 def main() -> None:
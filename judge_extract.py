@@ -10,12 +10,19 @@ until we pass the 24h cutoff. Output is written to both TXT and XLSX files.
 from __future__ import annotations
 
 import datetime as dt
-import json
 import math
-import urllib.request
-from typing import Dict, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, NamedTuple, Optional
 
-from openpyxl import Workbook
+import requests
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import dumps as json_dumps, loads as json_loads
 
 ENDPOINT = "https://www.judge.com/wp-admin/admin-ajax.php?action=jdg_get_jobs"
 HEADERS = {
@@ -23,6 +30,10 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (judge-job-scraper)",
 }
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 BASE_PAYLOAD: Dict = {
     "categories": [],
     "countries": "USA",
@@ -33,96 +44,137 @@ BASE_PAYLOAD: Dict = {
     "page": 0,
     "remote": False,
 }
+CONCURRENCY = 8  # pages requested in flight at once
+XLSX_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_urls": False,
+    "remove_timezone": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+
+class Job(NamedTuple):
+    id: Optional[int]
+    title: str
+    location: str
+    type: str
+    category: str
+    salary: str
+    opened: dt.datetime
+    url: str
 
 
 def fetch_page(page: int) -> Dict:
     payload = {"payload": {**BASE_PAYLOAD, "page": page}}
-    data = json.dumps(payload).encode()
-    req = urllib.request.Request(ENDPOINT, data=data, headers=HEADERS)
-    with urllib.request.urlopen(req) as resp:
-        outer = json.loads(resp.read().decode())
-    return json.loads(outer)
+    resp = SESSION.post(ENDPOINT, data=json_dumps(payload))
+    resp.raise_for_status()
+    # The endpoint returns the result object JSON-encoded inside a JSON string.
+    return json_loads(json_loads(resp.content))
 
 
+@lru_cache(maxsize=4096)
 def parse_opened(ts_ms: int) -> dt.datetime:
     return dt.datetime.fromtimestamp(ts_ms / 1000, tz=dt.timezone.utc)
 
 
-def collect_recent_jobs(cutoff: dt.datetime) -> List[dict]:
+def collect_recent_jobs(cutoff: dt.datetime) -> List[Job]:
     page = 0
-    recent: List[dict] = []
-
-    while True:
-        data = fetch_page(page)
-        hits = data.get("hits", [])
-        if not hits:
-            break
-
-        for job in hits:
-            opened_dt = parse_opened(job["opened"])
-            if opened_dt >= cutoff:
-                recent.append(
-                    {
-                        "id": job.get("jobOrderId"),
-                        "title": job.get("title", "").strip(),
-                        "location": (job.get("location") or "").strip(),
-                        "type": (job.get("type") or "").strip(),
-                        "category": (job.get("category", {}).get("description") or "").strip(),
-                        "salary": (job.get("salary") or "").strip(),
-                        "opened": opened_dt,
-                        "url": f"https://www.judge.com/jobs/details/{job.get('jobOrderId')}/",
-                    }
-                )
-
-        # Pagination guard: stop once oldest on this page is older than cutoff.
-        oldest = parse_opened(hits[-1]["opened"])
-        total = data.get("total", 0)
-        size = data.get("size", 20)
-        max_pages = math.ceil(total / size) if size else 0
-        page += 1
-        if oldest < cutoff or (max_pages and page >= max_pages):
-            break
-
-    recent.sort(key=lambda j: j["opened"], reverse=True)
+    max_pages = 0
+    recent: List[Job] = []
+    done = False
+
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as pool:
+        # Keep up to CONCURRENCY pages in flight and top the window up before
+        # parsing each page, so network waits overlap with the parse. Only the
+        # first page is requested up front because it reports the total.
+        pending = deque([pool.submit(fetch_page, 0)])
+        next_page = 1
+        try:
+            while pending and not done:
+                data = pending.popleft().result()
+                hits = data.get("hits", [])
+                if not hits:
+                    break
+
+                total = data.get("total", 0)
+                size = data.get("size", 20)
+                max_pages = math.ceil(total / size) if size else 0
+                while len(pending) < CONCURRENCY and (not max_pages or next_page < max_pages):
+                    pending.append(pool.submit(fetch_page, next_page))
+                    next_page += 1
+
+                for job in hits:
+                    opened_dt = parse_opened(job["opened"])
+                    if opened_dt < cutoff:
+                        # Pagination guard: hits are newest first, so the rest are older too.
+                        done = True
+                        break
+                    recent.append(
+                        Job(
+                            id=job.get("jobOrderId"),
+                            title=job.get("title", "").strip(),
+                            location=(job.get("location") or "").strip(),
+                            type=(job.get("type") or "").strip(),
+                            category=(job.get("category", {}).get("description") or "").strip(),
+                            salary=(job.get("salary") or "").strip(),
+                            opened=opened_dt,
+                            url=f"https://www.judge.com/jobs/details/{job.get('jobOrderId')}/",
+                        )
+                    )
+
+                page += 1
+                if max_pages and page >= max_pages:
+                    break
+        finally:
+            # Drop any prefetched requests that have not started yet.
+            for future in pending:
+                future.cancel()
+
+    recent.sort(key=attrgetter("opened"), reverse=True)
     return recent
 
 
-def write_text(jobs: List[dict], path: str) -> None:
-    lines = []
-    for job in jobs:
-        posted_str = job["opened"].strftime("%Y-%m-%d %H:%M:%SZ")
-        parts = [job["location"], job["type"], job["category"]]
-        summary = " | ".join(filter(None, parts))
-        lines.append(f"{job['title']} | {summary} | Posted: {posted_str} | {job['url']}")
-    output = "\n".join(lines) if lines else "No jobs found in the last 24 hours."
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(output)
-
-
-def write_excel(jobs: List[dict], path: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Judge Jobs (24h)"
-    ws.append(["Title", "Location", "Type", "Category", "Salary", "Posted (UTC)", "URL", "Job ID"])
-
-    for job in jobs:
-        ws.append(
-            [
-                job["title"],
-                job["location"],
-                job["type"],
-                job["category"],
-                job["salary"],
-                job["opened"].strftime("%Y-%m-%d %H:%M:%S"),
-                job["url"],
-                job["id"],
-            ]
+def format_line(job: Job) -> str:
+    posted_str = job.opened.isoformat(" ", "seconds").replace("+00:00", "Z")
+    parts = [job.location, job.type, job.category]
+    summary = " | ".join(filter(None, parts))
+    return f"{job.title} | {summary} | Posted: {posted_str} | {job.url}"
+
+
+def write_text(jobs: List[Job], path: str) -> None:
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if not jobs:
+            f.write("No jobs found in the last 24 hours.")
+            return
+        f.writelines(f"{format_line(job)}\n" for job in jobs)
+
+
+def write_excel(jobs: List[Job], path: str) -> None:
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(path, XLSX_OPTIONS)
+    ws = wb.add_worksheet("Judge Jobs (24h)")
+    for col, width in enumerate((60, 30, 15, 25, 15, 20, 70)):
+        ws.set_column(col, col, width)
+    ws.write_row(0, 0, ["Title", "Location", "Type", "Category", "Salary", "Posted (UTC)", "URL", "Job ID"])
+
+    for row, job in enumerate(jobs, 1):
+        ws.write_row(
+            row,
+            0,
+            (
+                job.title,
+                job.location,
+                job.type,
+                job.category,
+                job.salary,
+                job.opened,
+                job.url,
+                job.id,
+            ),
         )
 
-    for col, width in {"A": 60, "B": 30, "C": 15, "D": 25, "E": 15, "F": 20, "G": 70}.items():
-        ws.column_dimensions[col].width = width
-
-    wb.save(path)
+    wb.close()
 
 
 def main() -> None:
@@ -0,0 +1,36 @@
+"""Run all four job scrapers at once.
+
+Each scraper talks to a different host and spends nearly all of its time
+waiting on the network, so running their ``main`` functions on separate threads
+brings the total runtime down to roughly that of the slowest one.
+"""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import hays_extract
+import job_extract
+import judge_extract
+import yoh_extract
+
+SCRAPERS = (hays_extract, job_extract, judge_extract, yoh_extract)
+
+
+def main() -> None:
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as pool:
+        futures = {pool.submit(mod.main): mod.__name__ for mod in SCRAPERS}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as exc:  # keep the other scrapers' output
+                print(f"{futures[future]} failed: {exc}", file=sys.stderr)
+                failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
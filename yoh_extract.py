@@ -9,37 +9,66 @@ to keep only postings within the last day.
 from __future__ import annotations
 
 import datetime as dt
-import json
-import urllib.request
-from typing import List
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, NamedTuple, Optional
 
-from openpyxl import Workbook
+import requests
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as json_loads
+
+try:
+    from ciso8601 import parse_datetime as parse_iso
+except ImportError:  # ciso8601 is optional; fromisoformat needs "Z" spelled as an offset
+    def parse_iso(raw: str) -> dt.datetime:
+        return dt.datetime.fromisoformat(raw.replace("Z", "+00:00"))
 
 ENDPOINT = (
     "https://shazamme.io/Job-Listing/src/php/actions"
     "?dudaSiteID=4b57ce0f&action=Get%20Jobs"
 )
 HEADERS = {"User-Agent": "Mozilla/5.0 (yoh-job-scraper)"}
+XLSX_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_urls": False,
+    "remove_timezone": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+class Job(NamedTuple):
+    title: str
+    location: str
+    work_type: str
+    posted: dt.datetime
+    url: str
+    job_id: Optional[str]
+    reference: Optional[str]
 
 
 def fetch_jobs() -> List[dict]:
-    req = urllib.request.Request(ENDPOINT, headers=HEADERS)
-    with urllib.request.urlopen(req) as resp:
-        raw = resp.read().decode("utf-8", errors="ignore")
-    return json.loads(raw)
+    resp = SESSION.get(ENDPOINT)
+    resp.raise_for_status()
+    return json_loads(resp.content)
 
 
-def parse_timestamp(job: dict) -> dt.datetime | None:
+@lru_cache(maxsize=4096)
+def parse_timestamp(ts: str, posted: str) -> dt.datetime | None:
     """Prefer changedOnUTC (ISO) and fall back to postedDate (dd-mm-YYYY)."""
-    ts = job["data"].get("changedOnUTC") or ""
     if ts:
         try:
-            dt_obj = dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            return dt_obj if dt_obj.tzinfo else dt_obj.replace(tzinfo=dt.timezone.utc)
+            dt_obj = parse_iso(ts)
+            return dt_obj.astimezone(dt.timezone.utc) if dt_obj.tzinfo else dt_obj.replace(tzinfo=dt.timezone.utc)
         except ValueError:
             pass
 
-    posted = job["data"].get("postedDate") or ""
     if posted:
         try:
             # postedDate appears as dd-mm-YYYY
@@ -49,51 +78,50 @@ def parse_timestamp(job: dict) -> dt.datetime | None:
     return None
 
 
-def write_text(jobs: List[dict], path: str) -> None:
-    lines = []
-    for job in jobs:
-        data = job["data"]
-        posted_dt = parse_timestamp(job)
-        posted_str = posted_dt.astimezone(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ") if posted_dt else ""
-        location = ", ".join(
-            [part for part in (data.get("city"), data.get("state"), data.get("country")) if part]
-        )
-        lines.append(
-            f"{data.get('jobName','')} | {location} | {data.get('workType','')} | "
-            f"Posted: {posted_str} | {data.get('jobURL') or ''}"
-        )
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) if lines else "No jobs found in the last 24 hours.")
+def format_location(data: dict) -> str:
+    city, state, country = data.get("city"), data.get("state"), data.get("country")
+    location = f"{city}, {state}" if city and state else (city or state or "")
+    return f"{location}, {country}" if location and country else (location or country or "")
 
 
-def write_excel(jobs: List[dict], path: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Yoh Jobs (24h)"
-    ws.append(["Title", "Location", "Work Type", "Posted (UTC)", "URL", "Job ID", "Reference"])
+def format_line(job: Job) -> str:
+    posted_str = job.posted.isoformat(" ", "seconds").replace("+00:00", "Z")
+    return f"{job.title} | {job.location} | {job.work_type} | Posted: {posted_str} | {job.url}"
 
-    for job in jobs:
-        data = job["data"]
-        posted_dt = parse_timestamp(job)
-        posted_str = posted_dt.astimezone(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S") if posted_dt else ""
-        location = ", ".join(
-            [part for part in (data.get("city"), data.get("state"), data.get("country")) if part]
-        )
-        ws.append(
-            [
-                data.get("jobName"),
-                location,
-                data.get("workType"),
-                posted_str,
-                data.get("jobURL"),
-                data.get("jobID"),
-                data.get("referenceNumber"),
-            ]
+
+def write_text(jobs: List[Job], path: str) -> None:
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        if not jobs:
+            f.write("No jobs found in the last 24 hours.")
+            return
+        f.writelines(f"{format_line(job)}\n" for job in jobs)
+
+
+def write_excel(jobs: List[Job], path: str) -> None:
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(path, XLSX_OPTIONS)
+    ws = wb.add_worksheet("Yoh Jobs (24h)")
+    for col, width in enumerate((60, 30, 15, 20, 70)):
+        ws.set_column(col, col, width)
+    ws.write_row(0, 0, ["Title", "Location", "Work Type", "Posted (UTC)", "URL", "Job ID", "Reference"])
+
+    for row, job in enumerate(jobs, 1):
+        ws.write_row(
+            row,
+            0,
+            (
+                job.title,
+                job.location,
+                job.work_type,
+                job.posted,
+                job.url,
+                job.job_id,
+                job.reference,
+            ),
         )
 
-    for col, width in {"A": 60, "B": 30, "C": 15, "D": 20, "E": 70}.items():
-        ws.column_dimensions[col].width = width
-    wb.save(path)
+    wb.close()
 
 
 def main() -> None:
@@ -101,14 +129,25 @@ def main() -> None:
     cutoff = now - dt.timedelta(hours=24)
     all_jobs = fetch_jobs()
 
-    recent = []
+    recent: List[Job] = []
     for job in all_jobs:
-        ts = parse_timestamp(job)
+        data = job["data"]
+        ts = parse_timestamp(data.get("changedOnUTC") or "", data.get("postedDate") or "")
         if ts and ts >= cutoff:
-            recent.append(job)
+            recent.append(
+                Job(
+                    title=data.get("jobName") or "",
+                    location=format_location(data),
+                    work_type=data.get("workType") or "",
+                    posted=ts,
+                    url=data.get("jobURL") or "",
+                    job_id=data.get("jobID"),
+                    reference=data.get("referenceNumber"),
+                )
+            )
 
     # Sort newest first
-    recent.sort(key=lambda j: parse_timestamp(j) or dt.datetime.min.replace(tzinfo=dt.timezone.utc), reverse=True)
+    recent.sort(key=attrgetter("posted"), reverse=True)
 
     write_text(recent, "yoh_jobs_last_24h.txt")
     write_excel(recent, "yoh_jobs_last_24h.xlsx")